@@ -1,12 +1,17 @@
 ﻿# -*- coding: utf-8 -*-
 import base64, binascii, json, os, re, mimetypes as mime_types, uuid, zlib
+from binascii import b2a_base64
+from functools import lru_cache
 from io import StringIO, TextIOBase, BytesIO, BufferedRandom, IOBase, BufferedReader
+from threading import current_thread
 from urllib.parse import urlencode as url_encode
 from .quote import unquote
 
 from .export import export
 from .utils import imultidict, multidict
 from .ios import AsyncIO
+from .event_loop import EventThread
+from .futures import Task
 
 from .headers import (
     CONTENT_DISPOSITION,
@@ -19,17 +24,48 @@ from .helpers import content_disposition_header, CHAR, TOKEN
 from .protocol import ZLIB_COMPRESSOR, BROTLI_COMPRESSOR
 from .exceptions import ContentEncodingError
 
-BIG_CHUNK_LIMIT = 1 << 16
+BIG_CHUNK_LIMIT = 1 << 20
 DEFAULT_CONTENT_TYPE = 'application/octet-stream'
 
 VALID_TCHAR_RP = re.compile(br'\A[!#$%&\'*+\-.^_`|~\w]+\Z')
 INVALID_QDTEXT_CHAR_RP = re.compile(br'[\x00-\x08\x0A-\x1F\x7F]')
+ESCAPE_QUOTED_BOUNDARY_RP = re.compile(br'([\\"])')
+
+
+PAYLOAD_DISPATCH_TABLE = {}
+# Filled after the payload types are defined. Resolutions of not directly matched types are memoized into it as well.
+
+
+def _resolve_payload_type(data_type):
+    """
+    Resolves the payload type of the given data type by walking it's mro.
+
+    Parameters
+    ----------
+    data_type : `type`
+        The type to resolve the matching payload type of.
+
+    Returns
+    -------
+    type_ : `None` or ``PayloadBase`` subclass
+        The resolved payload type if any.
+    """
+    for base in data_type.__mro__:
+        try:
+            return PAYLOAD_DISPATCH_TABLE[base]
+        except KeyError:
+            pass
+
+    if hasattr(data_type, '__aiter__'):
+        return AsyncIterablePayload
+
+    return None
 
 
 def create_payload(data, kwargs):
     """
     Creates a new ``PayloadBase`` instance with the given parameters.
-    
+
     Parameters
     ----------
     data : (`list` of ``PayloadBase`` instances), ``BodyPartReader``, `bytes`, `bytearray`, `memoryview`, `str`, \
@@ -37,38 +73,24 @@ def create_payload(data, kwargs):
             `async-iterable` instance
     kwargs : `dict` of (`str`, (`None` or `str`)) items
         Keyword parameters for the payload.
-    
+
     Returns
     -------
     payload : ``PayloadBase``
-    
+
     Raises
     ------
     LookupError
         `payload` is not serializable.
     """
     data_type = data.__class__
-    # if issubclass(data_type, BodyPartReader):
-    #    type_ = BodyPartReaderPayload
-    if issubclass(data_type, (bytes, bytearray, memoryview)):
-        type_ = BytesPayload
-    elif issubclass(data_type, str):
-        type_ = StringPayload
-    elif issubclass(data_type, BytesIO):
-        type_ = BytesIOPayload
-    elif issubclass(data_type, StringIO):
-        type_ = StringIOPayload
-    elif issubclass(data_type, TextIOBase):
-        type_ = TextIOPayload
-    elif issubclass(data_type, (BufferedReader, BufferedRandom)):
-        type_ = BufferedReaderPayload
-    elif issubclass(data_type, IOBase):
-        type_ = IOBasePayload
-    elif issubclass(data_type, AsyncIO):
-        type_ = AsyncIOPayload
-    elif hasattr(data_type, '__aiter__'):
-        type_ = AsyncIterablePayload
-    else:
+    try:
+        type_ = PAYLOAD_DISPATCH_TABLE[data_type]
+    except KeyError:
+        type_ = _resolve_payload_type(data_type)
+        PAYLOAD_DISPATCH_TABLE[data_type] = type_
+
+    if type_ is None:
         raise LookupError(data_type)
 
     return type_(data, kwargs)
@@ -283,7 +305,11 @@ class StringPayload(BytesPayload):
                 content_type = f'text/plain; charset={encoding}'
                 kwargs['content_type'] = content_type
 
-        data = data.encode(encoding)
+        # Ascii only strings hit the fastest encoder independently of the actual (compatible) encoding.
+        if data.isascii() and (encoding in ('utf-8', 'ascii', 'latin-1')):
+            data = data.encode('ascii')
+        else:
+            data = data.encode(encoding)
 
         BytesPayload.__init__(self, data, kwargs)
 
@@ -343,10 +369,17 @@ class IOBasePayload(PayloadBase):
         Payload specific headers.
     size : `None` or `int`
         The payload's size if applicable.
+
+    Class Attributes
+    ----------------
+    chunk_size : `int` = `BIG_CHUNK_LIMIT`
+        The maximal amount of data to read and write at once. Subclasses may overwrite it.
     """
 
     __slots__ = ()
 
+    chunk_size = BIG_CHUNK_LIMIT
+
     def __init__(self, data, kwargs):
         """
         Creates a new ``IOBasePayload`` instance.
@@ -385,9 +418,10 @@ class IOBasePayload(PayloadBase):
             Http writer to write the payload's data to.
         """
         data = self.data
+        chunk_size = self.chunk_size
         try:
             while True:
-                chunk = data.read(BIG_CHUNK_LIMIT)
+                chunk = data.read(chunk_size)
                 if chunk:
                     await writer.write(chunk)
                 else:
@@ -469,9 +503,10 @@ class TextIOPayload(IOBasePayload):
             Http writer to write the payload's data to.
         """
         data = self.data
+        chunk_size = self.chunk_size
         try:
             while True:
-                chunk = data.read(BIG_CHUNK_LIMIT)
+                chunk = data.read(chunk_size)
                 if chunk:
                     await writer.write(chunk.encode(self.encoding))
                 else:
@@ -500,6 +535,8 @@ class BytesIOPayload(IOBasePayload):
         The payload's size if applicable.
     """
 
+    __slots__ = ()
+
     def __init__(self, data, kwargs):
         """
         Creates a new ``BytesIOPayload`` instance.
@@ -513,10 +550,8 @@ class BytesIOPayload(IOBasePayload):
         """
         IOBasePayload.__init__(self, data, kwargs)
 
-        position = data.tell()
-        end = data.seek(0, os.SEEK_END)
-        data.seek(position)
-        self.size = end - position
+        # `getbuffer` returns a zero-copy view, so the size query needs no seeking around.
+        self.size = data.getbuffer().nbytes - data.tell()
 
 
 class BufferedReaderPayload(IOBasePayload):
@@ -656,12 +691,34 @@ class AsyncIterablePayload(PayloadBase):
         """
         iterator = self._iterator
         anext = iterator.__class__.__anext__
+
+        loop = current_thread()
+        if not isinstance(loop, EventThread):
+            # Should not happen, but keep the serial path just in case.
+            try:
+                while True:
+                    chunk = await anext(iterator)
+                    await writer.write(chunk)
+            except StopAsyncIteration:
+                self._iterator = None
+            return
+
+        # Pipeline: start reading the next chunk while the previous one is being written out.
+        next_chunk_task = Task(anext(iterator), loop)
         try:
             while True:
-                chunk = await anext(iterator)
+                try:
+                    chunk = await next_chunk_task
+                except StopAsyncIteration:
+                    next_chunk_task = None
+                    self._iterator = None
+                    break
+
+                next_chunk_task = Task(anext(iterator), loop)
                 await writer.write(chunk)
-        except StopAsyncIteration:
-            self._iterator = None
+        finally:
+            if (next_chunk_task is not None) and next_chunk_task.pending():
+                next_chunk_task.cancel()
 
 
 class AsyncIOPayload(IOBasePayload):
@@ -684,6 +741,8 @@ class AsyncIOPayload(IOBasePayload):
         The payload's size if applicable.
     """
 
+    __slots__ = ()
+
     async def write(self, writer):
         """
         Writes the payload to the given http writer.
@@ -696,11 +755,12 @@ class AsyncIOPayload(IOBasePayload):
             Http writer to write the payload's data to.
         """
         data = self.data
+        chunk_size = self.chunk_size
         try:
             while True:
-                chunk = await data.read(BIG_CHUNK_LIMIT)
+                chunk = await data.read(chunk_size)
                 await writer.write(chunk)
-                if len(chunk) < BIG_CHUNK_LIMIT:
+                if len(chunk) < chunk_size:
                     break
         finally:
             data.close()
@@ -726,6 +786,8 @@ class BodyPartReaderPayload(PayloadBase):
         The payload's size if applicable.
     """
 
+    __slots__ = ()
+
     def __init__(self, data, kwargs):
         """
         Creates a new ``BodyPartReaderPayload`` instance.
@@ -771,6 +833,76 @@ class BodyPartReaderPayload(PayloadBase):
                 break
 
 
+PAYLOAD_DISPATCH_TABLE.update(
+    {
+        bytes: BytesPayload,
+        bytearray: BytesPayload,
+        memoryview: BytesPayload,
+        str: StringPayload,
+        BytesIO: BytesIOPayload,
+        StringIO: StringIOPayload,
+        TextIOBase: TextIOPayload,
+        BufferedReader: BufferedReaderPayload,
+        BufferedRandom: BufferedReaderPayload,
+        IOBase: IOBasePayload,
+        AsyncIO: AsyncIOPayload,
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_mime_type(mime_type):
+    """
+    Parses the given mime type string into it's components. Results are memoized, since content type strings
+    repeat a lot within the same application.
+
+    Parameters
+    ----------
+    mime_type : `str`
+        The mime type string to parse.
+
+    Returns
+    -------
+    type_ : `str`
+        The mime type's type.
+    sub_type : `str`
+        The mime type's sub type.
+    suffix : `str`
+        The mime type's suffix.
+    parameters : ``multidict`` of (`str`, `str`) items
+        Additional parameters of the mime type. Do not mutate, copy instead.
+    """
+    parts = mime_type.split(';')
+    parameters = multidict()
+    for item in parts[1:]:
+        if not item:
+            continue
+        if '=' in item:
+            key, value = item.split('=', 1)
+        else:
+            key = item
+            value = ''
+
+        parameters[key.strip().lower()] = value.strip(' "')
+
+    full_type = parts[0].strip().lower()
+    if full_type == '*':
+        full_type = '*/*'
+
+    if '/' in full_type:
+        type_, sub_type = full_type.split('/', 1)
+    else:
+        type_ = full_type
+        sub_type = ''
+
+    if '+' in sub_type:
+        sub_type, suffix = sub_type.split('+', 1)
+    else:
+        suffix = ''
+
+    return type_, sub_type, suffix, parameters
+
+
 @export
 class MimeType:
     # Parses a MIME type into its components
@@ -791,38 +923,12 @@ class MimeType:
             self.parameters = {}
             return
 
-        parts = mime_type.split(';')
-        parameters = multidict()
-        for item in parts[1:]:
-            if not item:
-                continue
-            if '=' in item:
-                key, value = item.split('=', 1)
-            else:
-                key = item
-                value = ''
-
-            parameters[key.strip().lower()] = value.strip(' "')
-
-        full_type = parts[0].strip().lower()
-        if full_type == '*':
-            full_type = '*/*'
-
-        if '/' in full_type:
-            type_, sub_type = full_type.split('/', 1)
-        else:
-            type_ = full_type
-            sub_type = ''
-
-        if '+' in sub_type:
-            sub_type, suffix = sub_type.split('+', 1)
-        else:
-            suffix = ''
+        type_, sub_type, suffix, parameters = _parse_mime_type(mime_type)
 
         self.type = type_
         self.sub_type = sub_type
         self.suffix = suffix
-        self.parameters = parameters
+        self.parameters = parameters.copy()
 
     def __repr__(self):
         return (
@@ -860,6 +966,9 @@ def _is_continuous_parameter(string):
     return substring.isdigit()
 
 
+TOKEN_FROZEN = frozenset(TOKEN)
+
+
 def _is_token(string):
     """
     Returns whether the given string can be a token of a content disposition parameter.
@@ -876,10 +985,7 @@ def _is_token(string):
     if not string:
         return False
 
-    if TOKEN < set(string):
-        return False
-
-    return True
+    return TOKEN_FROZEN.issuperset(string)
 
 
 def _is_quoted(string):
@@ -934,20 +1040,23 @@ def _is_rfc5987(string):
     return _is_token(string) and string.count("'") == 2
 
 
-def _unescape(text, *, chars=''.join(map(re.escape, CHAR))):
+UNESCAPE_RP = re.compile(f'\\\\([{"".join(map(re.escape, CHAR))}])')
+
+
+def _unescape(text):
     """
     Unescapes the given part of a content disposition parameter.
 
     Parameters
     ----------
-    string : `str`
-        The string to check.
+    text : `str`
+        The string to unescape.
 
     Returns
     -------
-    is_rfc5987 : `bool`
+    unescaped : `str`
     """
-    return re.sub(f'\\\\([{chars}])', '\\1', text)
+    return UNESCAPE_RP.sub('\\1', text)
 
 
 def parse_content_disposition(header):
@@ -976,8 +1085,11 @@ def parse_content_disposition(header):
         return None, {}
 
     parameters = {}
-    while parts:
-        item = parts.pop(0)
+    part_index = 0
+    part_limit = len(parts)
+    while part_index < part_limit:
+        item = parts[part_index]
+        part_index += 1
 
         if '=' not in item:
             return None, parameters
@@ -1016,12 +1128,13 @@ def parse_content_disposition(header):
 
             if _is_quoted(value):
                 value = _unescape(value[1:-1].lstrip('\\/'))
+                failed = False
             elif _is_token(value):
                 failed = False
-            elif parts:
-                joined_value = f'{value};{parts[0]}'
+            elif part_index < part_limit:
+                joined_value = f'{value};{parts[part_index]}'
                 if _is_quoted(joined_value):
-                    parts.pop(0)
+                    part_index += 1
                     value = _unescape(joined_value[1:-1].lstrip('\\/'))
                     failed = False
 
@@ -1064,18 +1177,23 @@ def content_disposition_filename(parameters, name='filename'):
     except KeyError:
         pass
 
-    parts = []
-    file_name_parameters = sorted(
-        (key, value) for key, value in parameters.items() if key.startswith('filename*')
-    )
-    for index, (key, value) in enumerate(file_name_parameters):
-        _, tail = key.split('*', 1)
+    parts_by_index = {}
+    for key, value in parameters.items():
+        if not key.startswith('filename*'):
+            continue
+
+        tail = key[9:]
         if tail.endswith('*'):
             tail = tail[:-1]
-        if tail == str(index):
-            parts.append(value)
-        else:
-            break
+
+        if tail.isdigit():
+            parts_by_index[int(tail)] = value
+
+    parts = []
+    index = 0
+    while index in parts_by_index:
+        parts.append(parts_by_index[index])
+        index += 1
 
     if not parts:
         return None
@@ -1109,9 +1227,13 @@ class MultipartWriter(PayloadBase):
         The payload's size if applicable.
     _boundary : `bytes`
         Boundary to mark the payload's start and end.
+    _part_frame : `bytes`
+        Pre-rendered `b'--'+boundary+b'\r\n'` frame opening each part.
+    _closing_frame : `bytes`
+        Pre-rendered `b'--'+boundary+b'--\r\n'` frame closing the multipart body.
     """
 
-    __slots__ = ('_boundary',)
+    __slots__ = ('_boundary', '_closing_frame', '_part_frame')
 
     def __init__(self, subtype='mixed', boundary=None):
         """
@@ -1153,13 +1275,15 @@ class MultipartWriter(PayloadBase):
         #                  ; any VCHAR, except delimiters
         # VCHAR = %x21-7E
 
-        if VALID_TCHAR_RP.match(boundary) is None:
+        if boundary.isalnum():
+            # Auto generated boundaries are uuid4 hex, always tchar valid; skip the regex work for those.
+            quoted_boundary = boundary.decode('ascii')
+        elif VALID_TCHAR_RP.match(boundary) is None:
             if INVALID_QDTEXT_CHAR_RP.search(boundary) is not None:
                 raise ValueError('Boundary value contains invalid characters.')
 
-            # escape %x5C and %x22
-            quoted_boundary = boundary.replace(b'\\', b'\\\\')
-            quoted_boundary = quoted_boundary.replace(b'"', b'\\"')
+            # escape %x5C and %x22 in a single pass
+            quoted_boundary = ESCAPE_QUOTED_BOUNDARY_RP.sub(br'\\\1', boundary)
             quoted_boundary = quoted_boundary.decode('ascii')
             quoted_boundary = f'"{quoted_boundary}"'
         else:
@@ -1170,6 +1294,8 @@ class MultipartWriter(PayloadBase):
         PayloadBase.__init__(self, [], kwargs)
 
         self._boundary = boundary
+        self._part_frame = b'--' + boundary + b'\r\n'
+        self._closing_frame = b'--' + boundary + b'--\r\n'
         self.headers[CONTENT_TYPE] = self.content_type
 
     @property
@@ -1283,47 +1409,57 @@ class MultipartWriter(PayloadBase):
                 )
 
         # Set size to payload headers if applicable.
-        size = payload.size
+        payload_size = payload.size
         if (
-            (size is not None)
+            (payload_size is not None)
             and (content_encoding is None)
             and (transfer_encoding is None)
         ):
-            payload_headers[CONTENT_LENGTH] = str(size)
+            payload_headers[CONTENT_LENGTH] = str(payload_size)
 
-        # Render headers.
+        # Render headers. Keys are ascii only by RFC, values might hold anything, so encode them as utf-8.
         result = []
         extend = result.extend
         for k, v in payload_headers.items():
-            extend((k, ': ', v, '\r\n'))
+            extend((k.encode('ascii'), b': ', v.encode('utf-8'), b'\r\n'))
 
-        result.append('\r\n')
+        result.append(b'\r\n')
 
-        headers = ''.join(result).encode('utf-8')
+        headers = b''.join(result)
 
         # Calculate new size.
         data = self.data
         if data:
             size = self.size
         else:
-            size = 6 + len(self._boundary)
-            # b'--'+self._boundary+b'--\r\n'
+            size = len(self._closing_frame)
 
         if size is not None:
             if (
                 (content_encoding is not None)
                 or (transfer_encoding is not None)
-                or (payload.size is None)
+                or (payload_size is None)
             ):
                 size = None
             else:
-                size += 6 + len(self._boundary) + payload.size + len(headers)
-                # b'--'+self._boundary+b'\r\n' ... data ... b'\r\n'
+                size += len(self._part_frame) + payload_size + len(headers) + 2
+                # part frame ... headers ... data ... b'\r\n'
 
             self.size = size
 
+        # Pre-render the whole part when the body is known bytes and needs no encoding, so writing it is a single
+        # writer call.
+        if (
+            (content_encoding is None)
+            and (transfer_encoding is None)
+            and isinstance(payload, BytesPayload)
+        ):
+            frame = b''.join((self._part_frame, headers, payload.data, b'\r\n'))
+        else:
+            frame = None
+
         # Add part.
-        data.append((payload, headers, content_encoding, transfer_encoding))
+        data.append((payload, headers, content_encoding, transfer_encoding, frame))
 
     def append_json(self, obj, headers=None):
         """
@@ -1404,8 +1540,12 @@ class MultipartWriter(PayloadBase):
         close_boundary : `bool`, Optional
             Whether the multipart's payload should be closed with it's boundary.
         """
-        for part, headers, content_encoding, transfer_encoding in self.data:
-            await writer.write(b'--' + self._boundary + b'\r\n')  # fb strings pls!
+        for part, headers, content_encoding, transfer_encoding, frame in self.data:
+            if frame is not None:
+                await writer.write(frame)
+                continue
+
+            await writer.write(self._part_frame)
             await writer.write(headers)
 
             if (content_encoding is not None) or (transfer_encoding is not None):
@@ -1420,13 +1560,24 @@ class MultipartWriter(PayloadBase):
             await writer.write(b'\r\n')
 
         if close_boundary:
-            await writer.write(b'--' + self._boundary + b'--\r\n')
+            await writer.write(self._closing_frame)
 
 
 TRANSFER_ENCODING_NONE = 0
 TRANSFER_ENCODING_BASE64 = 1
 TRANSFER_ENCODING_QUOTED_PRINTABLE = 2
 
+BASE64_FLUSH_LIMIT = 8190  # The greatest multiple of 3 under 8 KiB.
+
+QUOTED_PRINTABLE_TABLE = tuple(
+    bytes((byte,))
+    if ((byte > 32) and (byte < 127) and (byte != b'='[0]))
+    else f'={byte:02X}'.encode('ascii')
+    for byte in range(256)
+)
+
+QUOTED_PRINTABLE_LINE_LENGTH = 75  # Maximal line length, leaving space for the soft line break's `'='`.
+
 
 class MultipartPayloadWriter:
     """
@@ -1437,8 +1588,9 @@ class MultipartPayloadWriter:
     compressor : `None`, `ZLIB_COMPRESSOR`, `BROTLI_COMPRESSOR`
         The compressor matching the respective payload's content-encoding.
          used by the respective payload
-    encoding_buffer : `None` or `bytearray`
-        Buffer used when transfer-encoding is base64.
+    encoding_buffer : `None` or `bytes`
+        Unencoded data kept back in between writes, either to batch small writes up to ``BASE64_FLUSH_LIMIT`` or to
+        keep base64's 3 byte alignment.
     transfer_encoding : `int`
         The transfer encoding's identifier used by the multipart writer.
 
@@ -1535,13 +1687,17 @@ class MultipartPayloadWriter:
                 f'Can not decode content-encoding: {content_encoding!r}.'
             )
 
+        # Pick the write implementation at construction time, so the per-chunk hot path contains no transfer
+        # encoding dispatch.
         if transfer_encoding is None:
             transfer_encoding = TRANSFER_ENCODING_NONE
             encoding_buffer = None
         elif transfer_encoding == 'base64':
+            cls = MultipartPayloadBase64Writer
             transfer_encoding = TRANSFER_ENCODING_BASE64
-            encoding_buffer = bytearray()
+            encoding_buffer = b''
         elif transfer_encoding == 'quoted-printable':
+            cls = MultipartPayloadQuotedPrintableWriter
             transfer_encoding = TRANSFER_ENCODING_QUOTED_PRINTABLE
             encoding_buffer = None
         else:
@@ -1553,6 +1709,10 @@ class MultipartPayloadWriter:
         self.transfer_encoding = transfer_encoding
         self.compressor = compressor
         self.encoding_buffer = encoding_buffer
+
+        if transfer_encoding == TRANSFER_ENCODING_QUOTED_PRINTABLE:
+            self.encoding_column = 0
+
         return self
 
     async def write_eof(self):
@@ -1572,11 +1732,6 @@ class MultipartPayloadWriter:
             if chunk:
                 await self.write(chunk)
 
-        if self.transfer_encoding == TRANSFER_ENCODING_BASE64:
-            encoding_buffer = self.encoding_buffer
-            if encoding_buffer:
-                await self.writer.write(base64.b64encode(encoding_buffer))
-
     async def write(self, chunk):
         """
         Writes a chunk of data to the ``MultipartPayloadWriter``.
@@ -1595,27 +1750,121 @@ class MultipartPayloadWriter:
                 if not chunk:
                     return
 
-        transfer_encoding = self.transfer_encoding
-        if transfer_encoding == TRANSFER_ENCODING_BASE64:
-            encoding_buffer = self.encoding_buffer
-            encoding_buffer.extend(chunk)
+        await self.writer.write(chunk)
+
 
-            barrier = len(encoding_buffer)
-            if not barrier:
-                return
+class MultipartPayloadBase64Writer(MultipartPayloadWriter):
+    """
+    ``MultipartPayloadWriter`` subclass applying `'base64'` transfer encoding.
+
+    Attributes are the same as of ``MultipartPayloadWriter``.
+    """
+
+    __slots__ = ()
+
+    async def write_eof(self):
+        """
+        Writes eof to the writer ending the ``MultipartPayloadWriter``, but not to the ``HTTPStreamWriter``.
+
+        Flushes the compressor, then the unencoded residual with padding.
+
+        This method is a coroutine.
+        """
+        await MultipartPayloadWriter.write_eof(self)
+
+        encoding_buffer = self.encoding_buffer
+        if encoding_buffer:
+            self.encoding_buffer = b''
+            await self.writer.write(b2a_base64(encoding_buffer, newline=False))
+
+    async def write(self, chunk):
+        """
+        Writes a chunk of data to the ``MultipartPayloadWriter`` encoding it as base64.
+
+        This method is a coroutine.
+
+        Parameters
+        ----------
+        chunk : `bytes-like`
+            A chunk of data to write.
+        """
+        compressor = self.compressor
+        if compressor is not None:
+            if chunk:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    return
 
-            barrier = (barrier // 3) * 3
-            if not barrier:
-                return
+        encoding_buffer = self.encoding_buffer
+        if encoding_buffer:
+            chunk = encoding_buffer + chunk
 
-            chunk = encoding_buffer[:barrier]
-            del encoding_buffer[:barrier]
-            chunk = base64.b64encode(chunk)
+        length = len(chunk)
+        if length < BASE64_FLUSH_LIMIT:
+            # Batch small writes; each emit is a coroutine hop and maybe a syscall. ``.write_eof`` flushes the rest.
+            self.encoding_buffer = bytes(chunk)
+            return
 
-        elif transfer_encoding == TRANSFER_ENCODING_QUOTED_PRINTABLE:
-            chunk = binascii.b2a_qp(chunk)
+        residue = length % 3
 
+        if residue:
+            # Slice trough a memoryview, so the aligned portion is encoded without an intermediate copy.
+            view = memoryview(chunk)
+            self.encoding_buffer = bytes(view[length - residue :])
+            chunk = view[: length - residue]
         else:
-            pass
+            self.encoding_buffer = b''
 
-        await self.writer.write(chunk)
+        await self.writer.write(b2a_base64(chunk, newline=False))
+
+
+class MultipartPayloadQuotedPrintableWriter(MultipartPayloadWriter):
+    """
+    ``MultipartPayloadWriter`` subclass applying `'quoted-printable'` transfer encoding.
+
+    Attributes are the same as of ``MultipartPayloadWriter``, with the addition of:
+
+    Attributes
+    ----------
+    encoding_column : `int`
+        The current column of the encoded output's last line, carried across writes, so soft line breaks stay
+        correct at chunk boundaries.
+    """
+
+    __slots__ = ('encoding_column',)
+
+    async def write(self, chunk):
+        """
+        Writes a chunk of data to the ``MultipartPayloadWriter`` encoding it as quoted-printable.
+
+        This method is a coroutine.
+
+        Parameters
+        ----------
+        chunk : `bytes-like`
+            A chunk of data to write.
+        """
+        compressor = self.compressor
+        if compressor is not None:
+            if chunk:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    return
+
+        encoded = bytearray()
+        column = self.encoding_column
+        table = QUOTED_PRINTABLE_TABLE
+        for byte in chunk:
+            piece = table[byte]
+            piece_length = len(piece)
+            if column + piece_length > QUOTED_PRINTABLE_LINE_LENGTH:
+                encoded += b'=\r\n'
+                column = 0
+
+            encoded += piece
+            column += piece_length
+
+        self.encoding_column = column
+
+        if encoded:
+            await self.writer.write(bytes(encoded))
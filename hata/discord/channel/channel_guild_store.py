@@ -13,6 +13,41 @@ from ..preconverters import preconvert_snowflake, preconvert_str, preconvert_boo
 from .channel_base import ChannelBase
 from .channel_guild_base import ChannelGuildMainBase
 
+PERMISSION_MASK_VIEW_CHANNEL = 1 << Permission.__keys__['view_channel']
+PERMISSION_MASK_STORE_DENY = int(PERMISSION_TEXT_AND_VOICE_DENY)
+
+
+def _get_overwrites_signature(data):
+    """
+    Creates a lightweight fingerprint of the raw permission overwrite data of a channel. Matching fingerprints allow
+    to skip re-parsing unchanged overwrites without holding onto the raw values themselves.
+
+    Parameters
+    ----------
+    data : `dict` of (`str`, `Any`) items
+        Channel data received from Discord.
+
+    Returns
+    -------
+    signature : `None` or `int`
+        `None` if the data contains no overwrites.
+    """
+    overwrites_data = data.get('permission_overwrites', None)
+    if not overwrites_data:
+        return None
+
+    return hash(
+        tuple(
+            (
+                overwrite_data['id'],
+                overwrite_data.get('type', None),
+                overwrite_data.get('allow', None),
+                overwrite_data.get('deny', None),
+            )
+            for overwrite_data in overwrites_data
+        )
+    )
+
 
 @export
 class ChannelStore(ChannelGuildMainBase):
@@ -25,6 +60,11 @@ class ChannelStore(ChannelGuildMainBase):
         Unique identifier of the channel.
     _cache_perm : `None` or `dict` of (`int`, ``Permission``) items
         A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _display_name : `None` or `str`
+        The channel's cached display name. Defaults to `None`.
+    _overwrites_sig : `None` or `int`
+        Fingerprint of the channel's raw permission overwrite data, used to skip re-parsing unchanged overwrites.
+        Defaults to `None`.
     parent : `None`, ``ChannelCategory``
         The channel's parent. If the channel is deleted, set to `None`.
     guild : `None` or ``Guild``
@@ -51,7 +91,7 @@ class ChannelStore(ChannelGuildMainBase):
         The channel's Discord side type.
     """
 
-    __slots__ = ('nsfw',)  # guild channel store related
+    __slots__ = ('_display_name', '_overwrites_sig', 'nsfw')  # guild channel store related
 
     DEFAULT_TYPE = 6
     ORDER_GROUP = 0
@@ -77,9 +117,8 @@ class ChannelStore(ChannelGuildMainBase):
         ), f'`guild` parameter cannot be `None` when calling `{cls.__name__}.__new__`.'
 
         channel_id = int(data['id'])
-        try:
-            self = CHANNELS[channel_id]
-        except KeyError:
+        self = CHANNELS.get(channel_id, None)
+        if self is None:
             self = object.__new__(cls)
             self.id = channel_id
             CHANNELS[channel_id] = self
@@ -89,10 +128,12 @@ class ChannelStore(ChannelGuildMainBase):
 
         self._cache_perm = None
         self.name = data['name']
+        self._display_name = None
         self.nsfw = data.get('nsfw', False)
 
         self._init_parent_and_position(data, guild)
         self.overwrites = self._parse_overwrites(data)
+        self._overwrites_sig = _get_overwrites_signature(data)
 
         return self
 
@@ -104,21 +145,33 @@ class ChannelStore(ChannelGuildMainBase):
         )
 
         self.nsfw = False
+        self._display_name = None
+        self._overwrites_sig = None
 
         return self
 
     @property
     @copy_docs(ChannelBase.display_name)
     def display_name(self):
-        return self.name.lower()
+        display_name = self._display_name
+        if display_name is None:
+            display_name = self.name.lower()
+            self._display_name = display_name
+
+        return display_name
 
     @copy_docs(ChannelBase._update_no_return)
     def _update_no_return(self, data):
         self._cache_perm = None
         self._set_parent_and_position(data)
-        self.overwrites = self._parse_overwrites(data)
+
+        overwrites_signature = _get_overwrites_signature(data)
+        if overwrites_signature != self._overwrites_sig:
+            self._overwrites_sig = overwrites_signature
+            self.overwrites = self._parse_overwrites(data)
 
         self.name = data['name']
+        self._display_name = None
         self.nsfw = data.get('nsfw', False)
 
     def _update(self, data):
@@ -159,16 +212,20 @@ class ChannelStore(ChannelGuildMainBase):
         if self.name != name:
             old_attributes['name'] = self.name
             self.name = name
+            self._display_name = None
 
         nsfw = data.get('nsfw', False)
         if self.nsfw != nsfw:
             old_attributes['nsfw'] = self.nsfw
             self.nsfw = nsfw
 
-        overwrites = self._parse_overwrites(data)
-        if self.overwrites != overwrites:
-            old_attributes['overwrites'] = self.overwrites
-            self.overwrites = overwrites
+        overwrites_signature = _get_overwrites_signature(data)
+        if overwrites_signature != self._overwrites_sig:
+            self._overwrites_sig = overwrites_signature
+            overwrites = self._parse_overwrites(data)
+            if self.overwrites != overwrites:
+                old_attributes['overwrites'] = self.overwrites
+                self.overwrites = overwrites
 
         self._update_parent_and_position(data, old_attributes)
 
@@ -186,6 +243,7 @@ class ChannelStore(ChannelGuildMainBase):
         self.parent = None
 
         self.overwrites.clear()
+        self._overwrites_sig = None
         self._cache_perm = None
 
     @copy_docs(ChannelBase.permissions_for)
@@ -198,22 +256,20 @@ class ChannelStore(ChannelGuildMainBase):
             return PERMISSION_TEXT_AND_VOICE_DENY
 
         result = self._permissions_for(user)
-        if not result.can_view_channel:
+        if not result & PERMISSION_MASK_VIEW_CHANNEL:
             return PERMISSION_NONE
 
         # store channels do not have text and voice related permissions
-        result &= PERMISSION_TEXT_AND_VOICE_DENY
-
-        return Permission(result)
+        return Permission(result & PERMISSION_MASK_STORE_DENY)
 
     @copy_docs(ChannelBase.permissions_for_roles)
     def permissions_for_roles(self, *roles):
         result = self._permissions_for_roles(roles)
-        if not result.can_view_channel:
+        if not result & PERMISSION_MASK_VIEW_CHANNEL:
             return PERMISSION_NONE
 
         # store channels do not have text and voice related permissions
-        result &= PERMISSION_TEXT_AND_VOICE_DENY
+        return Permission(result & PERMISSION_MASK_STORE_DENY)
 
     @classmethod
     def precreate(cls, channel_id, **kwargs):
@@ -250,29 +306,26 @@ class ChannelStore(ChannelGuildMainBase):
         channel_id = preconvert_snowflake(channel_id, 'channel_id')
 
         if kwargs:
-            processable = []
-
             try:
                 name = kwargs.pop('name')
             except KeyError:
-                pass
+                name = None
             else:
                 name = preconvert_str(name, 'name', 2, 100)
-                processable.append(('name', name))
 
             try:
                 nsfw = kwargs.pop('nsfw')
             except KeyError:
-                pass
+                nsfw = None
             else:
                 nsfw = preconvert_bool(nsfw, 'nsfw')
-                processable.append(('nsfw', nsfw))
 
             if kwargs:
                 raise TypeError(f'Unused or unsettable attributes: {kwargs}')
 
         else:
-            processable = None
+            name = None
+            nsfw = None
 
         try:
             self = CHANNELS[channel_id]
@@ -284,8 +337,11 @@ class ChannelStore(ChannelGuildMainBase):
             if not self.partial:
                 return self
 
-        if processable is not None:
-            for item in processable:
-                setattr(self, *item)
+        if name is not None:
+            self.name = name
+            self._display_name = None
+
+        if nsfw is not None:
+            self.nsfw = nsfw
 
         return self
@@ -9,12 +9,12 @@ __all__ = (
 
 from os import urandom as random_bytes
 from base64 import b85encode as to_base85
+from sys import intern as intern_string
 import reprlib
 
 from ...backend.utils import copy_docs
 from ...backend.export import export
 
-from ..bases import PreinstancedBase
 from ..preconverters import preconvert_preinstanced_type
 from ..utils import url_cutter
 from ..emoji import create_partial_emoji_from_data, Emoji, create_partial_emoji_data
@@ -25,6 +25,9 @@ COMPONENT_TYPE_ROW = ComponentType.row
 COMPONENT_TYPE_BUTTON = ComponentType.button
 COMPONENT_TYPE_SELECT = ComponentType.select
 
+BUTTON_STYLE_INSTANCES = ButtonStyle.INSTANCES
+COMPONENT_TYPE_INSTANCES = ComponentType.INSTANCES
+
 COMPONENT_SUB_COMPONENT_LIMIT = 5
 COMPONENT_LABEL_LENGTH_MAX = 80
 COMPONENT_CUSTOM_ID_LENGTH_MAX = 100
@@ -97,7 +100,7 @@ def _debug_component_custom_id(custom_id):
     """
     if custom_id is None:
         pass
-    elif isinstance(custom_id, str):
+    elif (type(custom_id) is str) or isinstance(custom_id, str):
         custom_id_length = len(custom_id)
         if custom_id_length == 0:
             raise AssertionError(f'`custom_id` is not nullable.')
@@ -156,7 +159,7 @@ def _debug_component_label(label):
     """
     if label is None:
         pass
-    elif isinstance(label, str):
+    elif (type(label) is str) or isinstance(label, str):
         if len(label) > COMPONENT_LABEL_LENGTH_MAX:
             raise AssertionError(
                 f'`label`\'s max length can be {COMPONENT_LABEL_LENGTH_MAX!r}, got '
@@ -183,7 +186,7 @@ def _debug_component_enabled(enabled):
     AssertionError
         If `enabled` was not given as `bool` instance.
     """
-    if not isinstance(enabled, bool):
+    if (type(enabled) is not bool) and (not isinstance(enabled, bool)):
         raise AssertionError(
             f'`enabled` can be given as `bool` instance, got {enabled.__class__.__name__}.'
         )
@@ -205,7 +208,7 @@ def _debug_component_url(url):
     """
     if url is None:
         pass
-    elif isinstance(url, str):
+    elif (type(url) is str) or isinstance(url, str):
         pass
     else:
         raise AssertionError(
@@ -228,7 +231,7 @@ def _debug_component_value(value):
     AssertionError
         If `value` was not given as `str` instance.
     """
-    if not isinstance(value, str):
+    if (type(value) is not str) and (not isinstance(value, str)):
         raise AssertionError(
             f'`value` can be given either as  `str` instance, got '
             f'{value.__class__.__name__}.'
@@ -251,7 +254,7 @@ def _debug_component_description(description):
     """
     if description is None:
         pass
-    elif isinstance(description, str):
+    elif (type(description) is str) or isinstance(description, str):
         pass
     else:
         raise AssertionError(
@@ -274,7 +277,7 @@ def _debug_component_default(default):
     AssertionError
         If `default` was not given as `bool` instance.
     """
-    if not isinstance(default, bool):
+    if (type(default) is not bool) and (not isinstance(default, bool)):
         raise AssertionError(
             f'`default` can be given as `bool` instance, got {default.__class__.__name__}.'
         )
@@ -298,7 +301,7 @@ def _debug_component_options(options):
     """
     if options is None:
         option_length = 0
-    if isinstance(options, (tuple, list)):
+    elif isinstance(options, (tuple, list)):
         for option in options:
             if not isinstance(option, ComponentSelectOption):
                 raise AssertionError(
@@ -338,7 +341,7 @@ def _debug_component_placeholder(placeholder):
     """
     if placeholder is None:
         pass
-    elif isinstance(placeholder, str):
+    elif (type(placeholder) is str) or isinstance(placeholder, str):
         pass
     else:
         raise AssertionError(
@@ -362,7 +365,7 @@ def _debug_component_min_values(min_values):
         - If `min_values` was not given as `int` instance.
         - If `min_values`'s is out of range [0:15].
     """
-    if not isinstance(min_values, int):
+    if (type(min_values) is not int) and (not isinstance(min_values, int)):
         raise AssertionError(
             f'`min_values` can be given as `int` instance, got {min_values.__class__.__name__}.'
         )
@@ -391,7 +394,7 @@ def _debug_component_max_values(max_values):
         - If `max_values` was not given as `int` instance.
         - If `max_values`'s is out of range [1:25].
     """
-    if not isinstance(max_values, int):
+    if (type(max_values) is not int) and (not isinstance(max_values, int)):
         raise AssertionError(
             f'`max_values` can be given as `int` instance, got {max_values.__class__.__name__}.'
         )
@@ -405,6 +408,29 @@ def _debug_component_max_values(max_values):
         )
 
 
+REPR_STRING_LENGTH_MAX = 30
+
+
+def short_repr(value):
+    """
+    Returns the given string's representation, shortening it with `reprlib` when it is over
+    ``REPR_STRING_LENGTH_MAX`` characters.
+
+    Parameters
+    ----------
+    value : `str`
+        The string to represent.
+
+    Returns
+    -------
+    representation : `str`
+    """
+    if len(value) > REPR_STRING_LENGTH_MAX:
+        return reprlib.repr(value)
+
+    return repr(value)
+
+
 def create_auto_custom_id():
     """
     Creates a random custom identifier for components.
@@ -426,6 +452,8 @@ class ComponentBase:
     ----------------
     type : ``ComponentType`` = `ComponentType.none`
         The component's type.
+    type_value : `int` = `ComponentType.none.value`
+        The component's type's identifier value.
     custom_id : `NoneType` = `None`
         Placeholder for sub-classes without `custom_id` attribute.
     """
@@ -433,6 +461,7 @@ class ComponentBase:
     __slots__ = ()
 
     type = ComponentType.none
+    type_value = ComponentType.none.value
     custom_id = None
 
     @classmethod
@@ -460,7 +489,7 @@ class ComponentBase:
         -------
         data : `dict` of (`str`, `Any`) items
         """
-        data = {'type': self.type.value}
+        data = {'type': self.type_value}
 
         return data
 
@@ -501,7 +530,7 @@ class ComponentBase:
 
     def __hash__(self):
         """Returns the component's hash value."""
-        return self.type.value
+        return self.type_value
 
     def _iter_components(self):
         """
@@ -524,18 +553,21 @@ class ComponentRow(ComponentBase):
 
     Attributes
     ----------
-    components : `None` or `list` of ``ComponentBase`` instances
+    components : `None` or `tuple` of ``ComponentBase`` instances
         Stored components.
 
     Class Attributes
     ----------------
     type : ``ComponentType`` = `ComponentType.row`
         The component's type.
+    type_value : `int` = `ComponentType.row.value`
+        The component's type's identifier value.
     custom_id : `NoneType` = `None`
         `custom_id` is not applicable for component rows.
     """
 
     type = ComponentType.row
+    type_value = ComponentType.row.value
 
     __slots__ = ('components',)
 
@@ -573,16 +605,14 @@ class ComponentRow(ComponentBase):
         if (component_datas is None) or (not component_datas):
             components = None
         else:
-            components = [
-                create_component(component_data) for component_data in component_datas
-            ]
+            components = tuple(map(create_component, component_datas))
         self.components = components
 
         return self
 
     @copy_docs(ComponentBase.to_data)
     def to_data(self):
-        data = {'type': self.type.value}
+        data = {'type': self.type_value}
 
         components = self.components
         if components is None:
@@ -620,7 +650,7 @@ class ComponentRow(ComponentBase):
 
         components = self.components
         if components is not None:
-            components = [component.copy() for component in self.components]
+            components = tuple(component.copy() for component in components)
 
         new.components = components
 
@@ -657,9 +687,9 @@ class ComponentRow(ComponentBase):
             if not components:
                 components = None
 
-        self = object.__new__(cls)
-        self.components = components
-        return self
+        new = object.__new__(type(self))
+        new.components = components
+        return new
 
     @copy_docs(ComponentBase.__eq__)
     def __eq__(self, other):
@@ -673,15 +703,11 @@ class ComponentRow(ComponentBase):
 
     @copy_docs(ComponentBase.__hash__)
     def __hash__(self):
-        hash_value = self.type.value
-
         components = self.components
-        if components is not None:
-            hash_value ^= len(components) << 12
-            for component in components:
-                hash_value ^= hash(component)
+        if components is None:
+            components = ()
 
-        return hash_value
+        return hash((self.type_value, components))
 
     def _iter_components(self):
         """
@@ -706,6 +732,8 @@ class ComponentButton(ComponentBase):
 
     Attributes
     ----------
+    _hash : `int`
+        The button's cached hash value. Defaults to `0` if not yet computed.
     custom_id : `None` or `str`
         Custom identifier to detect which button was clicked by the user.
 
@@ -727,14 +755,18 @@ class ComponentButton(ComponentBase):
     ----------------
     type : ``ComponentType`` = `ComponentType.button`
         The component's type.
+    type_value : `int` = `ComponentType.button.value`
+        The component's type's identifier value.
     default_style : ``ButtonStyle`` = `ButtonStyle.violet`
         The default button style to use if style is not given.
     """
 
     type = ComponentType.button
+    type_value = ComponentType.button.value
     default_style = ButtonStyle.violet
 
     __slots__ = (
+        '_hash',
         'custom_id',
         'enabled',
         'emoji',
@@ -800,8 +832,11 @@ class ComponentButton(ComponentBase):
             _debug_component_enabled(enabled)
             _debug_component_url(url)
 
-        if (custom_id is not None) and (not custom_id):
-            custom_id = None
+        if custom_id is not None:
+            if custom_id:
+                custom_id = intern_string(custom_id)
+            else:
+                custom_id = None
 
         if (url is not None) and (not url):
             url = None
@@ -816,7 +851,7 @@ class ComponentButton(ComponentBase):
         if url is None:
             if style is None:
                 style = cls.default_style
-            else:
+            elif type(style) is not ButtonStyle:
                 style = preconvert_preinstanced_type(style, 'style', ButtonStyle)
 
             if custom_id is None:
@@ -830,6 +865,7 @@ class ComponentButton(ComponentBase):
 
         self = object.__new__(cls)
 
+        self._hash = 0
         self.style = style
         self.custom_id = custom_id
         self.emoji = emoji
@@ -844,31 +880,41 @@ class ComponentButton(ComponentBase):
     def from_data(cls, data):
         self = object.__new__(cls)
 
-        emoji_data = data.get('emoji', None)
+        self._hash = 0
+
+        data_get = data.get
+
+        emoji_data = data_get('emoji', None)
         if emoji_data is None:
             emoji = None
         else:
             emoji = create_partial_emoji_from_data(emoji_data)
         self.emoji = emoji
 
-        style = data.get('style', None)
+        style = data_get('style', None)
         if style is not None:
-            style = ButtonStyle.get(style)
+            try:
+                style = BUTTON_STYLE_INSTANCES[style]
+            except KeyError:
+                style = ButtonStyle.get(style)
         self.style = style
 
-        self.url = data.get('url', None)
+        self.url = data_get('url', None)
 
-        self.custom_id = data.get('custom_id', None)
+        custom_id = data_get('custom_id', None)
+        if custom_id is not None:
+            custom_id = intern_string(custom_id)
+        self.custom_id = custom_id
 
-        self.label = data.get('label', None)
+        self.label = data_get('label', None)
 
-        self.enabled = not data.get('disabled', False)
+        self.enabled = not data_get('disabled', False)
 
         return self
 
     @copy_docs(ComponentBase.to_data)
     def to_data(self):
-        data = {'type': self.type.value}
+        data = {'type': self.type_value}
 
         emoji = self.emoji
         if emoji is not None:
@@ -921,7 +967,7 @@ class ComponentButton(ComponentBase):
         label = self.label
         if label is not None:
             repr_parts.append(', label=')
-            repr_parts.append(reprlib.repr(label))
+            repr_parts.append(short_repr(label))
 
         url = self.url
         if url is not None:
@@ -931,7 +977,7 @@ class ComponentButton(ComponentBase):
         custom_id = self.custom_id
         if custom_id is not None:
             repr_parts.append(', custom_id=')
-            repr_parts.append(reprlib.repr(custom_id))
+            repr_parts.append(short_repr(custom_id))
 
         enabled = self.enabled
         if not enabled:
@@ -946,6 +992,7 @@ class ComponentButton(ComponentBase):
     def copy(self):
         new = object.__new__(type(self))
 
+        new._hash = self._hash
         new.custom_id = self.custom_id
         new.emoji = self.emoji
         new.style = self.style
@@ -1051,8 +1098,8 @@ class ComponentButton(ComponentBase):
 
         if url is None:
             if style is None:
-                style = cls.default_style
-            else:
+                style = self.default_style
+            elif type(style) is not ButtonStyle:
                 style = preconvert_preinstanced_type(style, 'style', ButtonStyle)
 
             if custom_id is None:
@@ -1063,6 +1110,7 @@ class ComponentButton(ComponentBase):
 
         new = object.__new__(type(self))
 
+        new._hash = 0
         new.custom_id = custom_id
         new.emoji = emoji
         new.style = style
@@ -1099,31 +1147,35 @@ class ComponentButton(ComponentBase):
 
     @copy_docs(ComponentBase.__hash__)
     def __hash__(self):
-        hash_value = self.type.value
+        hash_value = self._hash
+        if hash_value:
+            return hash_value
 
         emoji = self.emoji
-        if emoji is not None:
-            hash_value ^= emoji.id
+        if emoji is None:
+            emoji_id = 0
+        else:
+            emoji_id = emoji.id
 
         style = self.style
-        if style is not None:
-            hash_value ^= style.value
-
-        custom_id = self.custom_id
-        if custom_id is not None:
-            hash_value ^= hash(custom_id)
-
-        url = self.url
-        if url is not None:
-            hash_value ^= hash(url)
-
-        label = self.label
-        if label is not None:
-            hash_value ^= hash(label)
-
-        if self.enabled:
-            hash_value ^= 1 << 8
+        if style is None:
+            style_value = 0
+        else:
+            style_value = style.value
+
+        hash_value = hash(
+            (
+                self.type_value,
+                emoji_id,
+                style_value,
+                self.custom_id,
+                self.url,
+                self.label,
+                self.enabled,
+            )
+        )
 
+        self._hash = hash_value
         return hash_value
 
 
@@ -1133,6 +1185,8 @@ class ComponentSelectOption(ComponentBase):
 
     Attributes
     ----------
+    _hash : `int`
+        The option's cached hash value. Defaults to `0` if not yet computed.
     default : `bool`
         Whether this option is the default one.
     description : `None` or `str`
@@ -1152,7 +1206,7 @@ class ComponentSelectOption(ComponentBase):
         `custom_id` is not applicable for select options.
     """
 
-    __slots__ = ('default', 'description', 'emoji', 'label', 'value')
+    __slots__ = ('_hash', 'default', 'description', 'emoji', 'label', 'value')
 
     def __new__(cls, value, label, emoji=None, *, description=None, default=False):
         """
@@ -1185,11 +1239,12 @@ class ComponentSelectOption(ComponentBase):
             description = None
 
         self = object.__new__(cls)
+        self._hash = 0
         self.default = default
         self.description = description
         self.emoji = emoji
         self.label = label
-        self.value = value
+        self.value = intern_string(value)
         return self
 
     @classmethod
@@ -1197,11 +1252,15 @@ class ComponentSelectOption(ComponentBase):
     def from_data(cls, data):
         self = object.__new__(cls)
 
-        self.default = data.get('default', False)
+        self._hash = 0
 
-        self.description = data.get('description', None)
+        data_get = data.get
 
-        emoji_data = data.get('emoji', None)
+        self.default = data_get('default', False)
+
+        self.description = data_get('description', None)
+
+        emoji_data = data_get('emoji', None)
         if emoji_data is None:
             emoji = None
         else:
@@ -1210,7 +1269,7 @@ class ComponentSelectOption(ComponentBase):
 
         self.label = data['label']
 
-        self.value = data['value']
+        self.value = intern_string(data['value'])
 
         return self
 
@@ -1246,12 +1305,12 @@ class ComponentSelectOption(ComponentBase):
         label = self.label
         if label is not None:
             repr_parts.append(', label=')
-            repr_parts.append(reprlib.repr(label))
+            repr_parts.append(short_repr(label))
 
         description = self.description
         if description is not None:
             repr_parts.append(', description=')
-            repr_parts.append(reprlib.repr(description))
+            repr_parts.append(short_repr(description))
 
         if self.default:
             repr_parts.append(', default=')
@@ -1264,6 +1323,7 @@ class ComponentSelectOption(ComponentBase):
     @copy_docs(ComponentBase.copy)
     def copy(self):
         new = object.__new__(type(self))
+        new._hash = self._hash
         new.default = self.default
         new.description = self.description
         new.emoji = self.emoji
@@ -1347,6 +1407,7 @@ class ComponentSelectOption(ComponentBase):
             raise TypeError(f'Unused or unsettable attributes: {kwargs}')
 
         new = object.__new__(type(self))
+        new._hash = 0
         new.default = default
         new.description = description
         new.emoji = emoji
@@ -1356,27 +1417,21 @@ class ComponentSelectOption(ComponentBase):
 
     @copy_docs(ComponentBase.__hash__)
     def __hash__(self):
-        hash_value = 0
+        hash_value = self._hash
+        if hash_value:
+            return hash_value
 
         emoji = self.emoji
-        if emoji is not None:
-            hash_value ^= emoji.id
-
-        value = self.value
-        if value is not None:
-            hash_value ^= hash(value)
-
-        description = self.description
-        if description is not None:
-            hash_value ^= hash(description)
-
-        label = self.label
-        if label is not None:
-            hash_value ^= hash(label)
+        if emoji is None:
+            emoji_id = 0
+        else:
+            emoji_id = emoji.id
 
-        if self.default:
-            hash_value ^= 1 << 8
+        hash_value = hash(
+            (emoji_id, self.value, self.description, self.label, self.default)
+        )
 
+        self._hash = hash_value
         return hash_value
 
 
@@ -1386,11 +1441,13 @@ class ComponentSelect(ComponentBase):
 
     Attributes
     ----------
+    _hash : `int`
+        The select's cached hash value. Defaults to `0` if not yet computed.
     custom_id : `str`
         Custom identifier to detect which component was used by the user.
     enabled : `bool`
         Whether the component is enabled.
-    options : `list` of ``ComponentSelectOption``
+    options : `tuple` of ``ComponentSelectOption``
         Options of the select.
     placeholder : `str`
         Placeholder text of the select.
@@ -1403,11 +1460,15 @@ class ComponentSelect(ComponentBase):
     ----------------
     type : ``ComponentType`` = `ComponentType.select`
         The component's type.
+    type_value : `int` = `ComponentType.select.value`
+        The component's type's identifier value.
     """
 
     type = ComponentType.select
+    type_value = ComponentType.select.value
 
     __slots__ = (
+        '_hash',
         'custom_id',
         'enabled',
         'options',
@@ -1468,12 +1529,16 @@ class ComponentSelect(ComponentBase):
         if (placeholder is not None) and (not placeholder):
             placeholder = None
 
-        if (custom_id is not None) and (not custom_id):
-            custom_id = create_auto_custom_id()
+        if custom_id is not None:
+            if custom_id:
+                custom_id = intern_string(custom_id)
+            else:
+                custom_id = create_auto_custom_id()
 
-        options = list(options)
+        options = tuple(options)
 
         self = object.__new__(cls)
+        self._hash = 0
         self.custom_id = custom_id
         self.options = options
         self.placeholder = placeholder
@@ -1487,23 +1552,23 @@ class ComponentSelect(ComponentBase):
     def from_data(cls, data):
         self = object.__new__(cls)
 
-        option_datas = data['options']
-        self.options = [
-            ComponentSelectOption.from_data(option_data) for option_data in option_datas
-        ]
+        self._hash = 0
+
+        self.options = tuple(map(ComponentSelectOption.from_data, data['options']))
 
-        self.custom_id = data['custom_id']
-        self.placeholder = data.get('placeholder', None)
-        self.min_values = data.get('min_values', 1)
-        self.max_values = data.get('max_values', 1)
-        self.enabled = not data.get('disabled', False)
+        data_get = data.get
+        self.custom_id = intern_string(data['custom_id'])
+        self.placeholder = data_get('placeholder', None)
+        self.min_values = data_get('min_values', 1)
+        self.max_values = data_get('max_values', 1)
+        self.enabled = not data_get('disabled', False)
 
         return self
 
     @copy_docs(ComponentBase.to_data)
     def to_data(self):
         data = {
-            'type': self.type.value,
+            'type': self.type_value,
             'custom_id': self.custom_id,
             'options': [option.to_data() for option in self.options],
         }
@@ -1536,7 +1601,7 @@ class ComponentSelect(ComponentBase):
         repr_parts.append(')')
 
         repr_parts.append(', custom_id=')
-        repr_parts.append(reprlib.repr(self.custom_id))
+        repr_parts.append(short_repr(self.custom_id))
 
         options = self.options
         if options is not None:
@@ -1569,11 +1634,12 @@ class ComponentSelect(ComponentBase):
     def copy(self):
         new = object.__new__(type(self))
 
+        new._hash = self._hash
         new.custom_id = self.custom_id
 
         options = self.options
         if options is not None:
-            options = [option.copy() for option in options]
+            options = tuple(option.copy() for option in options)
 
         new.options = options
 
@@ -1618,12 +1684,12 @@ class ComponentSelect(ComponentBase):
         except KeyError:
             options = self.options
             if options is not None:
-                options = [option.copy() for option in options]
+                options = tuple(option.copy() for option in options)
         else:
             if __debug__:
                 _debug_component_options(options)
 
-            options = list(options)
+            options = tuple(options)
 
         try:
             custom_id = kwargs.pop('custom_id')
@@ -1674,14 +1740,15 @@ class ComponentSelect(ComponentBase):
         if kwargs:
             raise TypeError(f'Unused or unsettable attributes: {kwargs}')
 
-        self = object.__new__(type(self))
-        self.custom_id = custom_id
-        self.options = options
-        self.placeholder = placeholder
-        self.min_values = min_values
-        self.max_values = max_values
+        new = object.__new__(type(self))
+        new._hash = 0
+        new.custom_id = custom_id
+        new.options = options
+        new.placeholder = placeholder
+        new.min_values = min_values
+        new.max_values = max_values
         new.enabled = enabled
-        return self
+        return new
 
     @copy_docs(ComponentBase.__eq__)
     def __eq__(self, other):
@@ -1710,32 +1777,53 @@ class ComponentSelect(ComponentBase):
 
     @copy_docs(ComponentBase.__hash__)
     def __hash__(self):
-        hash_value = self.type.value ^ hash(self.custom_id)
+        hash_value = self._hash
+        if hash_value:
+            return hash_value
 
         options = self.options
-        if options is not None:
-            hash_value ^= len(options) << 12
-            for option in options:
-                hash_value ^= hash(option)
+        if options is None:
+            options = ()
+
+        hash_value = hash(
+            (
+                self.type_value,
+                self.custom_id,
+                options,
+                self.placeholder,
+                self.min_values,
+                self.max_values,
+                self.enabled,
+            )
+        )
 
-        placeholder = self.placeholder
-        if placeholder is not None:
-            hash_value ^= hash(placeholder)
+        self._hash = hash_value
+        return hash_value
 
-        hash_value ^= self.min_values
-        hash_value ^= self.max_values
 
-        if self.enabled:
-            hash_value ^= 1 << 8
+def _serialize_component_style(style):
+    """
+    Serializes the given component style field.
 
-        return hash_value
+    Parameters
+    ----------
+    style : `int` or ``PreinstancedBase`` instance
+        The style to serialize.
+
+    Returns
+    -------
+    style_value : `int`
+        The style's identifier value.
+    """
+    if type(style) is int:
+        return style
+
+    return style.value
 
 
 COMPONENT_DYNAMIC_SERIALIZERS = {
     'emoji': create_partial_emoji_data,
-    'style': lambda style: style.value
-    if isinstance(style, PreinstancedBase)
-    else style,
+    'style': _serialize_component_style,
 }
 
 
@@ -1797,18 +1885,23 @@ class ComponentDynamic(ComponentBase):
     @copy_docs(ComponentBase.from_data)
     def from_data(cls, data):
         self = object.__new__(cls)
-        self.type = ComponentType.get(data['type'])
+
+        type_value = data['type']
+        try:
+            type_ = COMPONENT_TYPE_INSTANCES[type_value]
+        except KeyError:
+            type_ = ComponentType.get(type_value)
+        self.type = type_
+
+        deserializers_get = COMPONENT_DYNAMIC_DESERIALIZERS.get
 
         validated_data = {}
         for key, value in data.items():
             if key == 'type':
                 continue
 
-            try:
-                deserializer = COMPONENT_DYNAMIC_DESERIALIZERS[key]
-            except KeyError:
-                pass
-            else:
+            deserializer = deserializers_get(key, None)
+            if deserializer is not None:
                 value = deserializer(value)
 
             validated_data[key] = value
@@ -1821,12 +1914,11 @@ class ComponentDynamic(ComponentBase):
     def to_data(self):
         data = {'type': self.type.value}
 
-        for key, value in self._data:
-            try:
-                serializer = COMPONENT_DYNAMIC_DESERIALIZERS[key]
-            except KeyError:
-                pass
-            else:
+        serializers_get = COMPONENT_DYNAMIC_SERIALIZERS.get
+
+        for key, value in self._data.items():
+            serializer = serializers_get(key, None)
+            if serializer is not None:
                 value = serializer(value)
 
             data[key] = value
@@ -1843,12 +1935,12 @@ class ComponentDynamic(ComponentBase):
         repr_parts.append(repr(type_.value))
         repr_parts.append(')')
 
-        for key, value in self._data:
+        for key, value in self._data.items():
             if value is None:
                 continue
 
             if isinstance(value, str):
-                value = reprlib.repr(value)
+                value = short_repr(value)
             else:
                 value = repr(value)
 
@@ -1918,6 +2010,20 @@ class ComponentDynamic(ComponentBase):
 
         return attribute_value
 
+    @property
+    def custom_id(self):
+        """
+        Returns the component's `custom_id` field if applicable.
+
+        `custom_id` is stored inside of `._data`, but since ``ComponentBase`` defines it as a class attribute as
+        well, `__getattr__` is never called for it, so it needs its own property.
+
+        Returns
+        -------
+        custom_id : `None` or `str`
+        """
+        return self._data.get('custom_id', None)
+
 
 COMPONENT_TYPE_TO_STYLE = {
     ComponentType.row: None,
@@ -1931,6 +2037,8 @@ COMPONENT_TYPE_VALUE_TO_TYPE = {
     ComponentType.select.value: ComponentSelect,
 }
 
+COMPONENT_TYPE_VALUE_TO_TYPE_GET = COMPONENT_TYPE_VALUE_TO_TYPE.get
+
 
 @export
 def create_component(component_data):
@@ -1947,6 +2055,6 @@ def create_component(component_data):
     component : ``ComponentBase``
         the created component instance.
     """
-    return COMPONENT_TYPE_VALUE_TO_TYPE.get(
+    return COMPONENT_TYPE_VALUE_TO_TYPE_GET(
         component_data['type'], ComponentDynamic
     ).from_data(component_data)
@@ -6,21 +6,57 @@ from re import (
     M as re_multi_line,
     S as re_dotall,
     I as re_ignore_case,
-    match as re_match,
 )
-from functools import partial as partial_func
+from functools import lru_cache, partial as partial_func
 
 from ...backend.utils import FunctionType
 from ...backend.analyzer import CallableAnalyzer
 from ...backend.export import include
 
 from .exceptions import CommandProcessingError
+from .utils import raw_name_to_display
 
 CheckBase = include('CheckBase')
 CommandCheckWrapper = include('CommandCheckWrapper')
 
-SUB_COMMAND_NAME_RP = re_compile('([a-zA-Z0-9_\-]+)\s*')
-COMMAND_NAME_RP = re_compile('\s*([^\s]*)\s*', re_multi_line | re_dotall)
+SUB_COMMAND_NAME_RP = re_compile(r'([A-Za-z0-9_\-]+)\s*')
+COMMAND_NAME_RP = re_compile(r'\s*(\S*)\s*', re_multi_line | re_dotall)
+
+PREFIX_RE_FLAGS = re_multi_line | re_dotall
+PREFIX_RE_FLAGS_IGNORE_CASE = re_ignore_case | PREFIX_RE_FLAGS
+
+
+@lru_cache(maxsize=256)
+def _compile_prefix(prefix, re_flags):
+    """
+    Compiles the given prefix to a regex pattern.
+
+    The results are cached, so when a callable prefix factory keeps returning the same value, the escape and compile
+    steps run only once per distinct prefix.
+
+    Parameters
+    ----------
+    prefix : `str` or `tuple` of `str`
+        The prefix(es) to compile.
+    re_flags : `int`
+        Regex matching flags.
+
+    Returns
+    -------
+    pattern : `re.Pattern`
+        The compiled prefix pattern.
+    """
+    if isinstance(prefix, str):
+        escaped_prefix = re_escape(prefix)
+    else:
+        # Sort the alternatives by decreasing length, so the longest matching prefix wins even if an other prefix
+        # is it's initial segment.
+        escaped_prefix = '|'.join(
+            re_escape(prefix_part)
+            for prefix_part in sorted(prefix, key=len, reverse=True)
+        )
+
+    return re_compile(escaped_prefix, re_flags)
 
 
 async def run_checks(checks, command_context):
@@ -104,44 +140,52 @@ def get_command_category_trace(command, content, index):
         command.command_category_name_to_command_category
     )
     if command_category_name_to_command_category is not None:
-        trace = []
+        sub_command_name_match = SUB_COMMAND_NAME_RP.match
+        command_category_get = command_category_name_to_command_category.get
+        name_converter = raw_name_to_display
+        trace_ends = []
+        trace_categories = []
         end = index
         while True:
-            if end == len(content):
-                break
-
-            parsed = SUB_COMMAND_NAME_RP.match(content, end)
+            # No length check needed; the pattern requires at least one character, so it cannot match at the end.
+            parsed = sub_command_name_match(content, end)
             if parsed is None:
                 break
 
             end = parsed.end()
             part = parsed.group(1)
-            name = raw_name_to_display(part)
 
-            try:
-                command_category = command_category_name_to_command_category[name]
-            except KeyError:
-                break
+            # Parts are usually typed in display form already; the conversion is idempotent on display names, so a
+            # direct probe with the raw part cannot produce a different category than the converted name would.
+            command_category = command_category_get(part, None)
+            if command_category is None:
+                command_category = command_category_get(name_converter(part), None)
+                if command_category is None:
+                    break
 
-            trace.append((end, command_category))
+            trace_ends.append(end)
+            trace_categories.append(command_category)
 
-            sub_commands = command_category._sub_commands
-            if sub_commands is None:
+            command_category_name_to_command_category = (
+                command_category.command_category_name_to_command_category
+            )
+            if command_category_name_to_command_category is None:
                 break
 
+            command_category_get = command_category_name_to_command_category.get
             continue
 
-        while trace:
-            end, command_category = trace[-1]
-            command_function = command_category._command_function
+        trace_index = len(trace_categories) - 1
+        while trace_index >= 0:
+            command_function = trace_categories[trace_index]._command_function
             if command_function is not None:
                 return (
-                    tuple(trace_element[1] for trace_element in trace),
+                    tuple(trace_categories[: trace_index + 1]),
                     command_function,
-                    end,
+                    trace_ends[trace_index],
                 )
 
-            del trace[-1]
+            trace_index -= 1
             continue
 
     return None, command._command_function, index
@@ -483,14 +527,14 @@ async def prefix_wrapper_async_callable(prefix_factory, re_flags, message):
     """
     prefix = await prefix_factory(message)
     if isinstance(prefix, str):
-        escaped_prefix = re_escape(prefix)
+        pass
     elif isinstance(prefix, tuple) and (len(prefix) > 0):
-        escaped_prefix = '|'.join(re_escape(prefix_part) for prefix_part in prefix)
+        pass
     else:
         return None, -1
 
     content = message.content
-    parsed = re_match(escaped_prefix, content, re_flags)
+    parsed = _compile_prefix(prefix, re_flags).match(content)
     if parsed is None:
         prefix = None
         end = -1
@@ -554,14 +598,14 @@ async def prefix_wrapper_sync_callable(prefix_factory, re_flags, message):
     """
     prefix = prefix_factory(message)
     if isinstance(prefix, str):
-        escaped_prefix = re_escape(prefix)
+        pass
     elif isinstance(prefix, tuple) and (len(prefix) > 0):
-        escaped_prefix = '|'.join(re_escape(prefix_part) for prefix_part in prefix)
+        pass
     else:
         return None, -1
 
     content = message.content
-    parsed = re_match(escaped_prefix, content, re_flags)
+    parsed = _compile_prefix(prefix, re_flags).match(content)
     if parsed is None:
         prefix = None
         end = -1
@@ -601,57 +645,213 @@ async def prefix_getter_sync_callable(prefix_factory, message):
     return prefix
 
 
-async def prefix_wrapper_regex(re_pattern, message):
+def _is_ascii(string):
     """
-    Function to execute asynchronous callable prefix.
+    Returns whether the given string contains only ascii characters.
 
-    This function is a coroutine.
+    Parameters
+    ----------
+    string : `str`
+        The string to check.
+
+    Returns
+    -------
+    is_ascii : `bool`
+    """
+    try:
+        string.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+
+    return True
+
+
+def build_prefix_wrapper_literal_ignore_case(prefix):
+    """
+    Creates a prefix parser matching the given ascii literal string prefix case insensitively.
 
     Parameters
     ----------
-    re_pattern : `async-callable`
-        Async callable returning the prefix.
-    message : ``Message``
-        The received message to parse the prefix from.
+    prefix : `str`
+        The prefix to match.
 
     Returns
     -------
-    prefix : `str` or `None`
-        The prefix used by the user. Returned as `None` of parsing failed.
-    end : `int`
-        The start of the content after the prefix. Returned as `-1` if parsing failed.
+    prefix_wrapper_literal_ignore_case : `async-callable`
+        Prefix parser accepting a ``Message`` and returning the matched prefix and it's end, or `None` and `-1` if
+        parsing failed.
     """
-    content = message.content
-    parsed = re_pattern.match(content)
-    if parsed is None:
-        prefix = None
-        end = -1
-    else:
-        prefix = parsed.group(0)
-        end = parsed.end()
+    prefix_lower = prefix.lower()
+    prefix_length = len(prefix)
 
-    return prefix, end
+    async def prefix_wrapper_literal_ignore_case(message):
+        """
+        Matches the captured literal string prefix against the message's content case insensitively.
 
+        This function is a coroutine.
+        """
+        matched = message.content[:prefix_length]
+        if matched.lower() == prefix_lower:
+            return matched, prefix_length
 
-async def prefix_getter_static(prefix, message):
+        return None, -1
+
+    return prefix_wrapper_literal_ignore_case
+
+
+def build_prefix_wrapper_literal_multi_ignore_case(prefixes):
     """
-    Returns a prefix for the message.
+    Creates a prefix parser matching the given ascii literal string prefixes case insensitively.
 
-    This function is a coroutine.
+    Parameters
+    ----------
+    prefixes : `tuple` of `str`
+        The prefixes to match.
+
+    Returns
+    -------
+    prefix_wrapper_literal_multi_ignore_case : `async-callable`
+        Prefix parser accepting a ``Message`` and returning the matched prefix and it's end, or `None` and `-1` if
+        parsing failed.
+    """
+    lowered_prefixes = tuple((prefix.lower(), len(prefix)) for prefix in prefixes)
+
+    async def prefix_wrapper_literal_multi_ignore_case(message):
+        """
+        Matches the captured literal string prefixes against the message's content case insensitively.
+
+        This function is a coroutine.
+        """
+        content = message.content
+        for prefix_lower, prefix_length in lowered_prefixes:
+            matched = content[:prefix_length]
+            if matched.lower() == prefix_lower:
+                return matched, prefix_length
+
+        return None, -1
+
+    return prefix_wrapper_literal_multi_ignore_case
+
+
+def build_prefix_wrapper_regex(re_pattern):
+    """
+    Creates a prefix parser matching with the given compiled regex pattern.
+
+    Parameters
+    ----------
+    re_pattern : `re.Pattern`
+        The compiled prefix pattern.
+
+    Returns
+    -------
+    prefix_wrapper_regex : `async-callable`
+        Prefix parser accepting a ``Message`` and returning the matched prefix and it's end, or `None` and `-1` if
+        parsing failed.
+    """
+    pattern_match = re_pattern.match
+
+    async def prefix_wrapper_regex(message):
+        """
+        Matches the captured prefix pattern against the message's content.
+
+        This function is a coroutine.
+        """
+        parsed = pattern_match(message.content)
+        if parsed is None:
+            return None, -1
+
+        return parsed.group(0), parsed.end()
+
+    return prefix_wrapper_regex
+
+
+def build_prefix_wrapper_literal(prefix):
+    """
+    Creates a prefix parser matching the given literal string prefix.
 
     Parameters
     ----------
     prefix : `str`
-        The prefix to return.
-    message : ``Message``
-        The received message to parse the prefix from.
+        The prefix to match.
+
+    Returns
+    -------
+    prefix_wrapper_literal : `async-callable`
+        Prefix parser accepting a ``Message`` and returning the matched prefix and it's end, or `None` and `-1` if
+        parsing failed.
+    """
+    prefix_length = len(prefix)
+
+    async def prefix_wrapper_literal(message):
+        """
+        Matches a literal string prefix against the message's content.
+
+        This function is a coroutine.
+        """
+        if message.content.startswith(prefix):
+            return prefix, prefix_length
+
+        return None, -1
+
+    return prefix_wrapper_literal
+
+
+def build_prefix_wrapper_literal_multi(prefixes):
+    """
+    Creates a prefix parser matching the given literal string prefixes.
+
+    Parameters
+    ----------
+    prefixes : `tuple` of `str`
+        The prefixes to match.
 
     Returns
     -------
+    prefix_wrapper_literal_multi : `async-callable`
+        Prefix parser accepting a ``Message`` and returning the matched prefix and it's end, or `None` and `-1` if
+        parsing failed.
+    """
+
+    async def prefix_wrapper_literal_multi(message):
+        """
+        Matches multiple literal string prefixes against the message's content.
+
+        This function is a coroutine.
+        """
+        content = message.content
+        for prefix in prefixes:
+            if content.startswith(prefix):
+                return prefix, len(prefix)
+
+        return None, -1
+
+    return prefix_wrapper_literal_multi
+
+
+def build_prefix_getter_static(prefix):
+    """
+    Creates a prefix getter returning the given static prefix.
+
+    Parameters
+    ----------
     prefix : `str`
-        The respective prefix for the message.
+        The prefix to return.
+
+    Returns
+    -------
+    prefix_getter_static : `async-callable`
+        Prefix getter accepting a ``Message`` and returning the prefix.
     """
-    return prefix
+
+    async def prefix_getter_static(message):
+        """
+        Returns the captured prefix.
+
+        This function is a coroutine.
+        """
+        return prefix
+
+    return prefix_getter_static
 
 
 def get_prefix_parser(prefix, prefix_ignore_case):
@@ -725,11 +925,9 @@ def get_prefix_parser(prefix, prefix_ignore_case):
         - Prefix is a callable but accepts bad amount of parameters.
     """
     if prefix_ignore_case:
-        re_flags = re_ignore_case
+        re_flags = PREFIX_RE_FLAGS_IGNORE_CASE
     else:
-        re_flags = 0
-
-    re_flags |= re_multi_line | re_dotall
+        re_flags = PREFIX_RE_FLAGS
 
     if callable(prefix):
         analyzed = CallableAnalyzer(prefix)
@@ -754,12 +952,38 @@ def get_prefix_parser(prefix, prefix_ignore_case):
 
     else:
         if isinstance(prefix, str):
-            escaped_prefix = re_escape(prefix)
+            if prefix_ignore_case:
+                if _is_ascii(prefix):
+                    # Ascii prefixes fold case trivially, no regex case folding needed.
+                    prefix_parser = build_prefix_wrapper_literal_ignore_case(prefix)
+                else:
+                    compiled_prefix = re_compile(re_escape(prefix), re_flags)
+                    prefix_parser = build_prefix_wrapper_regex(compiled_prefix)
+            else:
+                # Literal prefix matching runs fully at C level, no regex machinery needed.
+                prefix_parser = build_prefix_wrapper_literal(prefix)
+
         elif isinstance(prefix, tuple):
             if len(prefix) == 0:
                 raise ValueError(f'Empty prefix tuple.')
 
-            escaped_prefix = '|'.join(re_escape(prefix_part) for prefix_part in prefix)
+            ordered_prefixes = tuple(sorted(prefix, key=len, reverse=True))
+            if prefix_ignore_case:
+                if all(
+                    _is_ascii(prefix_part) for prefix_part in ordered_prefixes
+                ):
+                    prefix_parser = build_prefix_wrapper_literal_multi_ignore_case(
+                        ordered_prefixes
+                    )
+                else:
+                    escaped_prefix = '|'.join(
+                        re_escape(prefix_part) for prefix_part in ordered_prefixes
+                    )
+                    compiled_prefix = re_compile(escaped_prefix, re_flags)
+                    prefix_parser = build_prefix_wrapper_regex(compiled_prefix)
+            else:
+                prefix_parser = build_prefix_wrapper_literal_multi(ordered_prefixes)
+
             prefix = prefix[0]
         else:
             raise TypeError(
@@ -767,10 +991,7 @@ def get_prefix_parser(prefix, prefix_ignore_case):
                 f'`str`, got {prefix.__class__.__name__}.'
             )
 
-        compiled_prefix = re_compile(escaped_prefix, re_flags)
-
-        prefix_parser = partial_func(prefix_wrapper_regex, compiled_prefix)
-        prefix_getter = partial_func(prefix_getter_static, prefix)
+        prefix_getter = build_prefix_getter_static(prefix)
 
     return prefix_parser, prefix_getter
 
@@ -347,6 +347,7 @@ class CommandProcessor(EventWaitforBase):
         if not self._precheck(client, message):
             return
 
+        content = message.content
         prefix, end = await self._prefix_parser(message)
         if prefix is None:
             if not self._mention_prefix_enabled:
@@ -356,13 +357,13 @@ class CommandProcessor(EventWaitforBase):
             if (user_mentions is None) or (client not in user_mentions):
                 return
 
-            parsed = USER_MENTION_RP.match(message.content)
+            parsed = USER_MENTION_RP.match(content)
             if (parsed is None) or (int(parsed.group(1)) != client.id):
                 return
 
             end = parsed.end()
 
-        parsed = COMMAND_NAME_RP.match(message.content, end)
+        parsed = COMMAND_NAME_RP.match(content, end)
         if parsed is None:
             return
 
@@ -377,7 +378,7 @@ class CommandProcessor(EventWaitforBase):
             # do later, character lazy
             return
 
-        content = message.content[end:]
+        content = content[end:]
 
         if prefix is None:
             prefix = await self._prefix_getter(message)
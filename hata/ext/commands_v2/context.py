@@ -14,6 +14,12 @@ class CommandContext(object):
 
     Attributes
     ----------
+    _author : ``ClientUserBase``, ``Webhook``, ``WebhookRepr``
+        The message's author.
+    _channel : ``ChannelBase``
+        The message's channel.
+    _guild : `None` or ``Guild``
+        The message's guild.
     client : ``Client``
         The client who received the message.
     command : ``Command``
@@ -37,6 +43,9 @@ class CommandContext(object):
     """
 
     __slots__ = (
+        '_author',
+        '_channel',
+        '_guild',
         'client',
         'command',
         'command_category_trace',
@@ -67,6 +76,10 @@ class CommandContext(object):
         self = object.__new__(cls)
         self.client = client
         self.message = message
+        channel = message.channel
+        self._channel = channel
+        self._guild = channel.guild
+        self._author = message.author
         self.parameters = None
         self.prefix = prefix
         self.content = content
@@ -112,7 +125,7 @@ class CommandContext(object):
         -------
         channel : ``ChannelBase``
         """
-        return self.message.channel
+        return self._channel
 
     @property
     def guild(self):
@@ -123,7 +136,7 @@ class CommandContext(object):
         -------
         guild : `None` or ``Guild``
         """
-        return self.message.channel.guild
+        return self._guild
 
     @property
     def author(self):
@@ -134,7 +147,7 @@ class CommandContext(object):
         -------
         author : ``ClientUserBase``, ``Webhook``, ``WebhookRepr``
         """
-        return self.message.author
+        return self._author
 
     @property
     def voice_client(self):
@@ -145,7 +158,7 @@ class CommandContext(object):
         -------
         voice_client : `None` or ``VoiceClient``
         """
-        guild = self.message.chanenl.guild
+        guild = self._guild
         if guild is None:
             voice_client = None
         else:
@@ -1,10 +1,15 @@
 __all__ = ()
 
+from sys import intern as intern_string
+
 
 def raw_name_to_display(raw_name):
     """
     Converts the given raw command or it's parameter's name to it's display name.
 
+    The returned name is interned. The same display names show up both at registration and at every dispatch, so
+    interning lets the name lookups short circuit on identity.
+
     Parameters
     ----------
     raw_name : `str`
@@ -15,16 +20,18 @@ def raw_name_to_display(raw_name):
     display_name : `str`
         The converted name.
     """
-    return '-'.join(
-        [
-            w
-            for w in raw_name.strip('_ ')
-            .lower()
-            .replace(' ', '-')
-            .replace('_', '-')
-            .split('-')
-            if w
-        ]
+    return intern_string(
+        '-'.join(
+            [
+                w
+                for w in raw_name.strip('_ ')
+                .lower()
+                .replace(' ', '-')
+                .replace('_', '-')
+                .split('-')
+                if w
+            ]
+        )
     )
 
 
@@ -16,6 +16,9 @@ from ...discord.interaction import InteractionEvent
 
 from .components import acknowledge_component_interaction
 
+KOKORO_CALL_LATER = KOKORO.call_later
+KOKORO_CALL_AT = KOKORO.call_at
+
 
 class Timeouter:
     """
@@ -48,7 +51,7 @@ class Timeouter:
         """
         self._owner = owner
         self._timeout = 0.0
-        self._handle = KOKORO.call_later(timeout, type(self)._step, self)
+        self._handle = KOKORO_CALL_LATER(timeout, TIMEOUTER_STEP, self)
 
     def _step(self):
         """
@@ -59,7 +62,7 @@ class Timeouter:
         """
         timeout = self._timeout
         if timeout > 0.0:
-            self._handle = KOKORO.call_later(timeout, type(self)._step, self)
+            self._handle = KOKORO_CALL_LATER(timeout, TIMEOUTER_STEP, self)
             self._timeout = 0.0
             return
 
@@ -103,7 +106,7 @@ class Timeouter:
         planed_end = now + value
         if planed_end < next_step:
             handle.cancel()
-            self._handle = KOKORO.call_at(planed_end, type(self)._step, self)
+            self._handle = KOKORO_CALL_AT(planed_end, TIMEOUTER_STEP, self)
             return
 
         self._timeout = planed_end - next_step
@@ -125,6 +128,9 @@ class Timeouter:
         return handle.when - LOOP_TIME() + self._timeout
 
 
+TIMEOUTER_STEP = Timeouter._step
+
+
 class ComponentInteractionWaiter:
     """
     Waiter class for button press.
@@ -133,6 +139,8 @@ class ComponentInteractionWaiter:
     ----------
     _check : `None` or `callable`
         The check to call to validate whether the response is sufficient.
+    _client : ``Client``
+        The client who waits for component interaction.
     _finished : `bool`
         Whether the waiter finished.
     _future : ``Future``
@@ -143,7 +151,7 @@ class ComponentInteractionWaiter:
         Executes the timeout feature on the waiter.
     """
 
-    __slots__ = ('_check', '_finished', '_future', '_message', '_timeouter')
+    __slots__ = ('_check', '_client', '_finished', '_future', '_message', '_timeouter')
 
     def __new__(cls, client, message, check, timeout):
         """
@@ -161,6 +169,7 @@ class ComponentInteractionWaiter:
             The timeout till the waiting is done. If expires, `TimeoutError` is raised to ``._future``.
         """
         self = object.__new__(cls)
+        self._client = client
         self._finished = False
         self._future = Future(KOKORO)
         self._message = message
@@ -188,44 +197,41 @@ class ComponentInteractionWaiter:
         """
         check = self._check
         if check is None:
-            self._future.set_result_if_pending(interaction_event)
-            should_acknowledge = False
-        else:
-            try:
-                result = check(interaction_event)
-            except BaseException as err:
-                self._future.set_exception_if_pending(err)
-                should_acknowledge = False
-            else:
-                if isinstance(result, bool):
-                    if result:
-                        self._future.set_result_if_pending(interaction_event)
-                        should_acknowledge = False
-                    else:
-                        should_acknowledge = True
+            self._settle(interaction_event, None)
+            return
 
-                else:
-                    self._future.set_result_if_pending((interaction_event, result))
-                    should_acknowledge = False
+        try:
+            result = check(interaction_event)
+        except BaseException as err:
+            self._settle(None, err)
+            return
 
-        if should_acknowledge:
-            await acknowledge_component_interaction(interaction_event)
-        else:
-            self.cancel()
+        if isinstance(result, bool):
+            if not result:
+                await acknowledge_component_interaction(interaction_event)
+                return
 
-    def __await__(self):
-        """Awaits the waiter's result."""
-        return (yield from self._future)
+            self._settle(interaction_event, None)
+        else:
+            self._settle((interaction_event, result), None)
 
-    def cancel(self, exception=None):
+    def _settle(self, result, exception):
         """
-        Cancels the component waiter.
+        Sets the waiter's result or exception and tears the waiter down in a single pass.
 
         Parameters
         ----------
-        exception : `None` or ``BaseException``, Optional
-            The exception to cancel the waiter with.
+        result : `None`, ``InteractionEvent`` or `tuple` (``InteractionEvent``, `Any`)
+            The result to set to the waiter's future.
+        exception : `None` or ``BaseException``
+            The exception to set to the waiter's future instead, if any.
         """
+        future = self._future
+        if exception is None:
+            future.set_result_if_pending(result)
+        else:
+            future.set_exception_if_pending(exception)
+
         if self._finished:
             return
 
@@ -236,15 +242,26 @@ class ComponentInteractionWaiter:
             self._timeouter = None
             timeouter.cancel()
 
-        message = self._message
-        client = get_client_from_message(message)
-        client.slasher.remove_component_interaction_waiter(message, self)
+        self._client.slasher.remove_component_interaction_waiter(self._message, self)
 
+    def __await__(self):
+        """Awaits the waiter's result."""
         future = self._future
-        if exception is None:
-            future.set_result_if_pending(None)
-        else:
-            future.set_exception_if_pending(exception)
+        if future.done():
+            return future.result()
+
+        return (yield from future)
+
+    def cancel(self, exception=None):
+        """
+        Cancels the component waiter.
+
+        Parameters
+        ----------
+        exception : `None` or ``BaseException``, Optional
+            The exception to cancel the waiter with.
+        """
+        self._settle(None, exception)
 
 
 class ComponentInteractionIterator:
@@ -255,6 +272,8 @@ class ComponentInteractionIterator:
     ----------
     _check : `None` or `callable`
         The check to call to validate whether the response is sufficient.
+    _client : ``Client``
+        The client who waits for component interaction.
     _exception : `None` or ``BaseException``
         Whether the waiter finished with an exception.
     _finished : `bool`
@@ -263,8 +282,8 @@ class ComponentInteractionIterator:
         The waiter future.
     _message : ``Message``
         The waited interaction component's message.
-    _queue : `None` or `collections.deque`
-        A deque used to queue up interactions if needed.
+    _queue : `collections.deque`
+        A deque used to queue up interactions if needed. Allocated once and kept for the iterator's lifetime.
     _timeouter : `None` or ``Timeouter``
         Executes the timeout feature on the waiter.
     count : `int`
@@ -275,6 +294,7 @@ class ComponentInteractionIterator:
 
     __slots__ = (
         '_check',
+        '_client',
         '_exception',
         '_finished',
         '_future',
@@ -303,13 +323,14 @@ class ComponentInteractionIterator:
             The maximal amount of events to yield.
         """
         self = object.__new__(cls)
+        self._client = client
         self._exception = None
         self._future = None
         self._finished = False
         self._message = message
         self._check = check
         self._timeouter = None
-        self._queue = None
+        self._queue = deque()
         self.timeout = timeout
         self.count = count
 
@@ -368,19 +389,15 @@ class ComponentInteractionIterator:
         """
         future = self._future
         if future is None:
-            queue = self._queue
-            if queue is None:
-                queue = self._queue = deque()
-
-            queue.append(result)
+            self._queue.append(result)
         else:
-            self._future.set_result_if_pending(result)
+            future.set_result_if_pending(result)
 
         # Lol
-        timeout = self.timeout
         timeouter = self._timeouter
-        if (timeout is not None) and (timeouter is not None):
-            self._timeouter.set_timeout(timeout)
+        if timeouter is not None:
+            # A timeouter exists only if a timeout was given.
+            timeouter.set_timeout(self.timeout)
 
         count = self.count - 1
         if count:
@@ -394,22 +411,18 @@ class ComponentInteractionIterator:
         if future is None:
             # As it should be
             queue = self._queue
-            if queue is None:
-                # Check finished here :KoishiWink:
-                if self._finished:
-                    exception = self._exception
-                    if exception is None:
-                        return None
-                    else:
-                        raise exception
-
-                future = self._future = Future(KOKORO)
-            else:
-                result = queue.popleft()
-                if not queue:
-                    self._queue = None
+            if queue:
+                return queue.popleft()
+
+            # Check finished here :KoishiWink:
+            if self._finished:
+                exception = self._exception
+                if exception is None:
+                    return None
+                else:
+                    raise exception
 
-                return result
+            future = self._future = Future(KOKORO)
 
         try:
             return (yield from future)
@@ -436,9 +449,7 @@ class ComponentInteractionIterator:
             self._timeouter = None
             timeouter.cancel()
 
-        message = self._message
-        client = get_client_from_message(message)
-        client.slasher.remove_component_interaction_waiter(message, self)
+        self._client.slasher.remove_component_interaction_waiter(self._message, self)
 
         future = self._future
         if future is not None:
@@ -463,12 +474,11 @@ def get_client_from_message(message):
     else:
         application_id = message.application_id
         if application_id:
-            try:
-                client = APPLICATION_ID_TO_CLIENT[application_id]
-            except KeyError as err:
+            client = APPLICATION_ID_TO_CLIENT.get(application_id, None)
+            if client is None:
                 raise RuntimeError(
                     f'The message is bound to a 3rd party application, got: {message!r}.'
-                ) from err
+                )
         else:
             raise RuntimeError(
                 f'The given message has no bound interaction, got {message!r}.'
@@ -496,13 +506,12 @@ def get_client_from_interaction_event(interaction_event):
     RuntimeError
         - The interaction is bound to a 3rd party application.
     """
-    try:
-        client = APPLICATION_ID_TO_CLIENT[interaction_event.application_id]
-    except KeyError as err:
+    client = APPLICATION_ID_TO_CLIENT.get(interaction_event.application_id, None)
+    if client is None:
         raise RuntimeError(
             f'The message or interaction is bound to a 3rd party application, got: '
             f'{interaction_event!r}.'
-        ) from err
+        )
 
     return client
 